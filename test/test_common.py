@@ -0,0 +1,79 @@
+"""
+Tests for the udiskie.common module.
+"""
+
+import unittest
+
+import os.path
+import tempfile
+
+from udiskie.common import Emitter, samefile, sameuuid
+
+
+class TestEmitter(unittest.TestCase):
+
+    """
+    Tests for the udiskie.common.Emitter class.
+    """
+
+    def test_trigger(self):
+        """All connected handlers receive the event arguments."""
+        emitter = Emitter(['event'])
+        calls = []
+        emitter.connect('event', lambda *args: calls.append(('a',) + args))
+        emitter.connect('event', lambda *args: calls.append(('b',) + args))
+        emitter.trigger('event', 1, 2)
+        self.assertEqual([('a', 1, 2), ('b', 1, 2)], calls)
+
+    def test_disconnect_during_trigger(self):
+        """A handler that disconnects itself doesn't skip the next one."""
+        emitter = Emitter(['event'])
+        calls = []
+
+        def once():
+            calls.append('once')
+            emitter.disconnect('event', once)
+
+        emitter.connect('event', once)
+        emitter.connect('event', lambda: calls.append('next'))
+        emitter.trigger('event')
+        self.assertEqual(['once', 'next'], calls)
+        emitter.trigger('event')
+        self.assertEqual(['once', 'next', 'next'], calls)
+
+
+class TestSamefile(unittest.TestCase):
+
+    """
+    Tests for the udiskie.common.samefile and sameuuid functions.
+    """
+
+    def test_empty_path(self):
+        """The empty path is not the current directory."""
+        self.assertFalse(samefile('.', ''))
+
+    def test_stat_failure(self):
+        """Paths that can't be stat()ed are compared in normalized form."""
+        with tempfile.TemporaryDirectory() as base:
+            missing = os.path.join(base, 'missing')
+            self.assertTrue(samefile(missing, os.path.join(
+                base, '.', 'missing')))
+            self.assertFalse(samefile(missing, os.path.join(base, 'other')))
+
+    def test_identical_strings(self):
+        """Identical paths are equal without calling the key function."""
+        def key(path):
+            raise AssertionError('key called for {!r}'.format(path))
+        self.assertTrue(samefile('/no/such/file', '/no/such/file', key))
+
+    def test_sameuuid(self):
+        """UUIDs compare case-insensitively, and never equal when unset."""
+        self.assertIs(True, sameuuid('AbCd-1234', 'abcd-1234'))
+        self.assertIs(False, sameuuid('abcd-1234', 'abcd-5678'))
+        self.assertIs(False, sameuuid('', ''))
+        self.assertIs(False, sameuuid(None, None))
+        self.assertIs(False, sameuuid('abcd-1234', None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,7 +12,8 @@ import shutil
 import os.path
 import gc
 
-from udiskie.config import Config, match_config
+from udiskie.config import (
+    Config, DeviceFilter, IgnoreDevice, match_config, select_filters)
 
 
 class TestDev:
@@ -33,6 +34,8 @@ class TestFilterMatcher(unittest.TestCase):
 
     def setUp(self):
         """Create a temporary config file."""
+        # don't let parsed files from other tests leak into this one:
+        Config.clear_cache()
         self.base = tempfile.mkdtemp()
         self.config_file = os.path.join(self.base, 'filters.conf')
 
@@ -58,6 +61,7 @@ ignore_device:
 
     def tearDown(self):
         """Remove the config file."""
+        Config.clear_cache()
         gc.collect()
         shutil.rmtree(self.base)
 
@@ -92,6 +96,72 @@ ignore_device:
             self.mount_options(
                 TestDev('/nomatch', 'ext', 'no-matching-id')))
 
+    def test_reload(self):
+        """Test that a modified config file is parsed again."""
+        with open(self.config_file, 'at') as f:
+            f.write('''
+- id_uuid: another-DEVICE
+''')
+        stat = os.stat(self.config_file)
+        os.utime(self.config_file, ns=(stat.st_atime_ns,
+                                       stat.st_mtime_ns + 10**9))
+        self.filters = Config.from_file(self.config_file).device_config
+        self.assertTrue(
+            self.ignore_device(
+                TestDev('/another', 'ext', 'ANOTHER-device')))
+
+    def test_reload_same_mtime(self):
+        """Test that a resized config file is parsed again."""
+        Config.from_file(self.config_file)
+        stat = os.stat(self.config_file)
+        with open(self.config_file, 'at') as f:
+            f.write('''
+- id_uuid: another-DEVICE
+''')
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.filters = Config.from_file(self.config_file).device_config
+        self.assertTrue(
+            self.ignore_device(
+                TestDev('/another', 'ext', 'ANOTHER-device')))
+
+    def test_patterns(self):
+        """Test glob, list and non-string patterns."""
+        rule = DeviceFilter({'id_type': ['ntfs', 'EXT?'],
+                             'id_uuid': '*-device'})
+        self.assertTrue(rule.match(TestDev('/glob', 'ext4', 'SOME-DEVICE')))
+        self.assertFalse(rule.match(TestDev('/glob', 'ext44', 'some-device')))
+        self.assertFalse(rule.match(TestDev('/glob', 'vfat', 'some-device')))
+        device = TestDev('/list', 'vfat', 'uuid')
+        device.symlinks = ['/dev/disk/by-id/usb-STICK', '/dev/disk/by-uuid/x']
+        self.assertTrue(DeviceFilter({'symlinks': '*/BY-ID/usb-*'}).match(device))
+        self.assertFalse(DeviceFilter({'symlinks': '/dev/mapper/*'}).match(device))
+        self.assertFalse(DeviceFilter({'symlinks': '*'}).match(
+            TestDev('/missing', 'vfat', 'uuid')))
+        rule = DeviceFilter({'device_file': False})
+        self.assertTrue(rule.match(TestDev(False, 'vfat', 'uuid')))
+        self.assertFalse(rule.match(TestDev('False', 'vfat', 'uuid')))
+
+    def test_skip(self):
+        """Test that 'skip' rules end the lookup for the device."""
+        filters = [DeviceFilter({'id_uuid': 'skipped', 'skip': True}),
+                   IgnoreDevice({'id_type': 'vfat'})]
+        self.assertFalse(match_config(
+            filters, TestDev('/skip', 'vfat', 'skipped'), 'ignore', False))
+        self.assertTrue(match_config(
+            filters, TestDev('/noskip', 'vfat', 'other'), 'ignore', False))
+
+    def test_select_filters(self):
+        """Test that only the filters relevant for a lookup are selected."""
+        catch_all = IgnoreDevice({'ignore': False})
+        selected = select_filters(self.filters + [catch_all], 'ignore')
+        self.assertEqual(2, len(selected))
+        self.assertIs(catch_all, selected[-1])
+        self.assertEqual(
+            (catch_all,), select_filters([catch_all] + self.filters, 'ignore'))
+        self.assertEqual(2, len(select_filters(self.filters, 'options')))
+        self.assertFalse(
+            match_config(selected, TestDev('/x', 'ext', 'x'), 'ignore', True))
+
 
 if __name__ == '__main__':
     unittest.main()
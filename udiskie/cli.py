@@ -5,24 +5,15 @@ The application classes in this module are installed as executables via
 setuptools entry points.
 """
 
-# import udiskie.depend first - for side effects!
-from .depend import has_Notify, has_Gtk, _in_X, _in_Wayland, has_AppIndicator3
-
-import inspect
-import logging.config
+import logging
+import textwrap
 import traceback
 
-from gi.repository import GLib
-
 from docopt import docopt, DocoptExit
 
 import udiskie
-import udiskie.config
-import udiskie.mount
-import udiskie.udisks2
 from .common import extend, ObjDictView
 from .locale import _
-from .async_ import Future, ensure_future, gather
 
 
 __all__ = [
@@ -94,6 +85,59 @@ class SelectLevel(logging.Filter):
         return record.levelno == self.level
 
 
+# log level that the root logger was last configured with:
+_configured_level = None
+
+
+def _configure_logging(log_level):
+    """
+    Configure the root logger. Repeated calls with the same level, e.g. when
+    running several entry points in one process, are skipped.
+    """
+    global _configured_level
+    if log_level == _configured_level:
+        return
+    import logging.config
+    debug = log_level <= logging.DEBUG
+    handlers = {
+        'info':  {'class': 'logging.StreamHandler',
+                  'stream': 'ext://sys.stdout',
+                  'formatter': 'plain',
+                  'filters': ['info']},
+        'error': {'class': 'logging.StreamHandler',
+                  'stream': 'ext://sys.stderr',
+                  'formatter': 'plain',
+                  'level': 'WARNING'},
+        'debug': {'class': 'logging.StreamHandler',
+                  'stream': 'ext://sys.stderr',
+                  'formatter': 'detail'},
+    }
+    # dictConfig instantiates every listed handler, so leave out those
+    # that would never receive any records:
+    used_handlers = ['debug' if debug else 'error']
+    if log_level <= logging.INFO:
+        used_handlers.insert(0, 'info')
+    logging.config.dictConfig({
+        'version': 1,
+        'disable_existing_loggers': False,
+        'formatters': {
+            'plain':  {'format': _('%(message)s')},
+            'detail': {'format': _(
+                '%(levelname)s [%(asctime)s] %(name)s: %(message)s')},
+        },
+        'filters': {
+            'info': {'()': 'udiskie.cli.SelectLevel', 'level': logging.INFO},
+        },
+        'handlers': {name: handlers[name] for name in used_handlers},
+        # configure root logger:
+        'root': {
+            'handlers': used_handlers,
+            'level': log_level,
+        },
+    })
+    _configured_level = log_level
+
+
 class _EntryPoint:
 
     """
@@ -127,41 +171,16 @@ class _EntryPoint:
         """Parse command line options, read config and initialize members."""
         # parse program options (retrieve log level and config file name):
         args = docopt(self.usage, version='udiskie ' + self.version)
+        # import what is needed for actual work only after docopt had the
+        # chance to exit on --help, --version or invalid arguments.
+        # import udiskie.depend first - for side effects!
+        import udiskie.depend
+        import udiskie.config
         default_opts = self.option_defaults
         program_opts = self.program_options(args)
         # initialize logging configuration:
         log_level = program_opts.get('log_level', default_opts['log_level'])
-        debug = log_level <= logging.DEBUG
-        logging.config.dictConfig({
-            'version': 1,
-            'disable_existing_loggers': False,
-            'formatters': {
-                'plain':  {'format': _('%(message)s')},
-                'detail': {'format': _(
-                    '%(levelname)s [%(asctime)s] %(name)s: %(message)s')},
-            },
-            'filters': {
-                'info': {'()': 'udiskie.cli.SelectLevel', 'level': logging.INFO},
-            },
-            'handlers': {
-                'info':  {'class': 'logging.StreamHandler',
-                          'stream': 'ext://sys.stdout',
-                          'formatter': 'plain',
-                          'filters': ['info']},
-                'error': {'class': 'logging.StreamHandler',
-                          'stream': 'ext://sys.stderr',
-                          'formatter': 'plain',
-                          'level': 'WARNING'},
-                'debug': {'class': 'logging.StreamHandler',
-                          'stream': 'ext://sys.stderr',
-                          'formatter': 'detail'},
-            },
-            # configure root logger:
-            'root': {
-                'handlers': ['info', 'debug' if debug else 'error'],
-                'level': log_level,
-            },
-        })
+        _configure_logging(log_level)
         # parse config options
         config_file = OptionalValue('--config')(args)
         config = udiskie.config.Config.from_file(config_file)
@@ -195,7 +214,9 @@ class _EntryPoint:
     @property
     def usage(self):
         """Full usage string."""
-        return inspect.cleandoc(self.__doc__ + self.usage_remarks)
+        # same as inspect.cleandoc() for our docstrings, but without having
+        # to import the heavy inspect module on every startup:
+        return textwrap.dedent(self.__doc__ + self.usage_remarks).strip()
 
     def _init(self):
         """Return the application main task as Future."""
@@ -203,6 +224,10 @@ class _EntryPoint:
 
     def run(self):
         """Run the main loop. Returns exit code."""
+        # GLib and the modules built on it are only needed from here on, not
+        # for printing usage or rejecting invalid arguments:
+        from gi.repository import GLib
+        from udiskie.async_ import ensure_future
         self.exit_code = 1
         self.mainloop = GLib.MainLoop()
         try:
@@ -218,6 +243,7 @@ class _EntryPoint:
 
     async def _start_async_tasks(self):
         """Start asynchronous operations."""
+        import udiskie.udisks2
         try:
             self.udisks = await udiskie.udisks2.Daemon.create()
             results = await self._init()
@@ -353,7 +379,11 @@ class Daemon(_EntryPoint):
     })
 
     def _init(self):
+        import udiskie.mount
         import udiskie.prompt
+        from udiskie.async_ import Future, gather
+        from udiskie.depend import (
+            has_Notify, has_Gtk, _in_X, _in_Wayland, has_AppIndicator3)
 
         config = self.config
         options = self.options
@@ -432,14 +462,14 @@ class Daemon(_EntryPoint):
         self.automounter.activate()
 
         if options['notify_command']:
-            logging.getLogger(__name__).warn(_(
+            logging.getLogger(__name__).warning(_(
                 "The 'notify_command' option was renamed to 'event_hook'. "
                 "The old name still works, but may be removed in a future version. "
                 "Please change your command line and config to use the new name."))
             if options['event_hook'] is None:
                 options['event_hook'] = options['notify_command']
             else:
-                logging.getLogger(__name__).warn(_(
+                logging.getLogger(__name__).warning(_(
                     "Ignoring 'notify_command' in favor of 'event_hook'."))
 
         if options['notify']:
@@ -459,7 +489,8 @@ class Daemon(_EntryPoint):
 
     def _load_notify(self):
         import udiskie.notify
-        from gi.repository import Notify
+        from udiskie.depend import require_Notify
+        Notify = require_Notify()
         Notify.init('udiskie')
         aconfig = self.config.notification_actions
         if self.options['automount']:
@@ -477,7 +508,9 @@ class Daemon(_EntryPoint):
         return udiskie.prompt.connect_event_hook(command, self.mounter)
 
     def _load_statusicon(self):
+        import udiskie.mount
         import udiskie.tray
+        from udiskie.depend import _in_Wayland
         options = self.options
         config = self.config
 
@@ -568,7 +601,10 @@ class Mount(_EntryPoint):
 
     def _init(self):
 
+        import udiskie.config
+        import udiskie.mount
         import udiskie.prompt
+        from udiskie.async_ import gather
 
         config = self.config
         options = self.options
@@ -647,6 +683,9 @@ class Umount(_EntryPoint):
 
     def _init(self):
 
+        import udiskie.mount
+        from udiskie.async_ import gather
+
         config = self.config
         options = self.options
 
@@ -659,8 +698,10 @@ class Umount(_EntryPoint):
                         lock=options['lock'])
         if options['<device>']:
             strategy['force'] = options['force']
-            tasks = [mounter.remove(path, **strategy)
-                     for path in options['<device>']]
+            # resolve all paths using a single pass over the device list:
+            devices = self.udisks.find_all(options['<device>'])
+            tasks = [mounter.remove(device, **strategy)
+                     for device in devices]
         else:
             tasks = [mounter.remove_all(**strategy)]
         return gather(*tasks)
@@ -724,6 +765,10 @@ class Info(_EntryPoint):
 
     def _init(self):
 
+        import udiskie.config
+        import udiskie.mount
+        from udiskie.async_ import gather
+
         config = self.config
         options = self.options
 
@@ -5,11 +5,13 @@ Common utilities.
 import os.path
 import sys
 import traceback
+from functools import wraps
 
 
 __all__ = [
     'wraps',
     'Emitter',
+    'file_key',
     'samefile',
     'sameuuid',
     'setdefault',
@@ -18,25 +20,21 @@ __all__ = [
     'decode_ay',
     'exc_message',
     'format_exc',
+    'LazyTraceback',
 ]
 
 
-try:
-    from black_magic.decorator import wraps
-except ImportError:
-    from functools import wraps
-
-
 class Emitter:
 
     """Simple event emitter for a known finite set of events."""
 
     def __init__(self, event_names=(), *args, **kwargs):
-        """Initialize with empty lists of event handlers."""
+        """Initialize with empty tuples of event handlers."""
         super().__init__(*args, **kwargs)
-        self._event_handlers = {}
-        for evt in event_names:
-            self._event_handlers[evt] = []
+        # Handlers are kept in tuples that are replaced on (dis)connect. This
+        # way, trigger() can iterate over them directly without a copy, even
+        # if a handler (dis)connects handlers for the same event:
+        self._event_handlers = dict.fromkeys(event_names, ())
 
     def trigger(self, event, *args):
         """Trigger event by name."""
@@ -45,37 +43,52 @@ class Emitter:
 
     def connect(self, event, handler):
         """Connect an event handler."""
-        self._event_handlers[event].append(handler)
+        self._event_handlers[event] += (handler,)
 
     def disconnect(self, event, handler):
         """Disconnect an event handler."""
-        self._event_handlers[event].remove(handler)
+        handlers = list(self._event_handlers[event])
+        handlers.remove(handler)
+        self._event_handlers[event] = tuple(handlers)
 
 
-def samefile(a: str, b: str) -> bool:
-    """Check if two paths represent the same file."""
+def file_key(path: str):
+    """
+    Identify a file by its (st_dev, st_ino) pair, or by its normalized path
+    if it can't be stat()ed.
+    """
     try:
-        return os.path.samefile(a, b)
+        st = os.stat(path)
     except OSError:
-        return os.path.normpath(a) == os.path.normpath(b)
+        return os.path.normpath(path)
+    return (st.st_dev, st.st_ino)
+
+
+def samefile(a: str, b: str, key=file_key) -> bool:
+    """
+    Check if two paths represent the same file.
+
+    A memoized ``key`` function can be passed in when comparing the same
+    paths many times.
+    """
+    return a == b or key(a) == key(b)
 
 
 def sameuuid(a: str, b: str) -> bool:
     """Compare two UUIDs."""
-    return a and b and a.lower() == b.lower()
+    if not a or not b:
+        return False
+    return a == b or a.lower() == b.lower()
 
 
 def setdefault(self: dict, other: dict):
     """Like .update() but values in self take priority."""
-    for k, v in other.items():
-        self.setdefault(k, v)
+    self.update({**other, **self})
 
 
 def extend(a: dict, b: dict) -> dict:
     """Merge two dicts and return a new dict. Much like subclassing works."""
-    res = a.copy()
-    res.update(b)
-    return res
+    return {**a, **b}
 
 
 def cachedmethod(func):
@@ -97,37 +110,55 @@ def cachedmethod(func):
     return get
 
 
-def cachedproperty(func):
-    """A memoize decorator for class properties."""
-    key = '_' + func.__name__
+class cachedproperty:
 
-    @wraps(func)
-    def get(self):
-        try:
-            return getattr(self, key)
-        except AttributeError:
-            val = func(self)
-            setattr(self, key, val)
-            return val
-    return property(get)
+    """
+    A memoize decorator for class properties.
+
+    The value is stored in the instance ``__dict__`` under the property's
+    own name. Being a non-data descriptor, the property itself is then
+    shadowed and later reads are plain attribute lookups.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.__name__ = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        # store the value under the attribute name, which can differ from the
+        # function name, e.g. for ``alias = cachedproperty(func)``:
+        self.__name__ = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        val = instance.__dict__[self.__name__] = self.func(instance)
+        return val
 
 
 # ----------------------------------------
 # udisks.Device helper classes
 # ----------------------------------------
 
+# marks missing values in the views below:
+_MISSING = object()
+
+
 class AttrDictView:
 
     """Provide attribute access view to a dictionary."""
 
+    __slots__ = ('__data',)
+
     def __init__(self, data):
         self.__data = data
 
     def __getattr__(self, key):
-        try:
-            return self.__data[key]
-        except KeyError:
-            raise AttributeError(key) from None
+        value = self.__data.get(key, _MISSING)
+        if value is _MISSING:
+            raise AttributeError(key)
+        return value
 
 
 class ObjDictView:
@@ -140,10 +171,10 @@ class ObjDictView:
 
     def __getitem__(self, key):
         if self._valid is None or key in self._valid:
-            try:
-                return getattr(self._object, key)
-            except AttributeError:
-                raise KeyError(key) from None
+            value = getattr(self._object, key, _MISSING)
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
         raise KeyError("Unknown key: {}".format(key))
 
 
@@ -170,15 +201,15 @@ class DaemonBase:
 
 def decode_ay(ay):
     """Convert binary blob from DBus queries to strings."""
-    if ay is None:
-        return ''
-    elif isinstance(ay, str):
+    if isinstance(ay, str):
         return ay
+    elif ay is None:
+        return ''
     elif isinstance(ay, bytes):
         return ay.decode('utf-8')
     else:
         # dbus.Array([dbus.Byte]) or any similar sequence type:
-        return bytearray(ay).rstrip(bytearray((0,))).decode('utf-8')
+        return bytes(ay).rstrip(b'\x00').decode('utf-8')
 
 
 def is_utf8(bs):
@@ -201,3 +232,19 @@ def format_exc(*exc_info):
     typ, exc, tb = exc_info or sys.exc_info()
     error = traceback.format_exception(typ, exc, tb)
     return "".join(error)
+
+
+class LazyTraceback:
+
+    """
+    Exception with traceback that is only formatted when converted to str.
+
+    Pass this to log calls so the traceback is not formatted when the log
+    level discards the message anyway.
+    """
+
+    def __init__(self, *exc_info):
+        self.exc_info = exc_info or sys.exc_info()
+
+    def __str__(self):
+        return format_exc(*self.exc_info)
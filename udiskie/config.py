@@ -7,7 +7,9 @@ installed, a raw version is available in doc/udiskie.8.txt.
 
 import logging
 import os
+import re
 import fnmatch
+from functools import lru_cache
 
 from .common import exc_message
 from .locale import _
@@ -15,14 +17,17 @@ from .locale import _
 
 __all__ = ['DeviceFilter',
            'match_config',
+           'select_filters',
            'Config']
 
 
-def lower(s):
-    try:
-        return s.lower()
-    except AttributeError:
-        return s
+# marks device attributes that are missing in DeviceFilter.match():
+_MISSING = object()
+
+# resolved only once, the environment is not expected to change at runtime:
+_config_home = (
+    os.environ.get('XDG_CONFIG_HOME') or
+    os.path.expanduser('~/.config'))
 
 
 def format_dict(d):
@@ -39,21 +44,89 @@ def _format_item(k, v):
         return '{}={}'.format(k, v)
 
 
-def match_value(value, pattern):
-    if isinstance(value, (list, tuple)):
-        return any(match_value(v, pattern) for v in value)
+def compile_pattern(pattern):
+    """
+    Compile a matching attribute from the config into a function that
+    checks whether a device attribute value matches.
+
+    Strings are case insensitive glob patterns, lists match if any of their
+    items matches. If the device attribute value is a list, it matches if
+    any of its items matches.
+    """
+    match = _compile_pattern(pattern)
+
+    def match_value(value):
+        if isinstance(value, (list, tuple)):
+            # list attributes (symlinks, mount_paths) hold plain strings:
+            return any(map(match, value))
+        return match(value)
+    return match_value
+
+
+def _compile_pattern(pattern):
     if isinstance(pattern, (list, tuple)):
-        return any(match_value(value, p) for p in pattern)
-    if isinstance(value, str) and isinstance(pattern, str):
-        return fnmatch.fnmatch(value.lower(), pattern.lower())
-    return lower(value) == lower(pattern)
+        # a list of globs can be combined into a single regex:
+        if pattern and all(isinstance(p, str) for p in pattern):
+            return _compile_glob(*pattern)
+        matchers = [_compile_pattern(p) for p in pattern]
+        return lambda value: any(match(value) for match in matchers)
+    if isinstance(pattern, str):
+        return _compile_glob(pattern)
+    # non-string patterns (booleans, numbers) can't equal a string, so values
+    # need no lowering:
+    return lambda value: value == pattern
+
+
+def _compile_glob(*patterns):
+    """Compile one or more alternative case insensitive glob patterns."""
+    patterns = [p.lower() for p in patterns]
+    # most patterns in practice are plain values, e.g. 'ext4' or a UUID,
+    # which don't need the regex engine:
+    if not any(c in p for p in patterns for c in '*?['):
+        literals = frozenset(patterns)
+
+        def match(value):
+            if isinstance(value, str):
+                return value.lower() in literals
+            return value in patterns
+        return match
+    glob = re.compile('|'.join(map(fnmatch.translate, patterns))).match
+
+    def match(value):
+        if isinstance(value, str):
+            return glob(value.lower()) is not None
+        return value in patterns
+    return match
+
+
+# Device attributes that are computed by looking at other devices, e.g. the
+# parent, drive or LUKS cleartext device. Rules check these after the others,
+# so that a cheap mismatch can short-circuit the evaluation:
+_COSTLY_ATTRIBUTES = frozenset([
+    'is_partition',
+    'is_toplevel',
+    'is_luks_cleartext',
+    'is_detachable',
+    'is_ejectable',
+    'has_media',
+    'is_unlocked',
+    'in_use',
+    'ui_label',
+    'drive_model',
+    'drive_vendor',
+    'drive_label',
+    'ui_device_label',
+    'ui_device_presentation',
+    'ui_id_label',
+    'ui_id_uuid',
+])
 
 
 class DeviceFilter:
 
     """Associate a certain value to matching devices."""
 
-    VALID_PARAMETERS = [
+    VALID_PARAMETERS = frozenset([
         'is_drive',
         'is_block',
         'is_partition_table',
@@ -98,12 +171,20 @@ class DeviceFilter:
         'ui_device_presentation',
         'ui_id_label',
         'ui_id_uuid',
-    ]
+    ])
+
+    __slots__ = ('_match', '_values', '_matchers')
+
+    # values that subclasses associate with devices unless configured:
+    _defaults = {}
+
+    # shared by all rules, rather than looked up for every instance:
+    _log = logging.getLogger(__name__)
 
     def __init__(self, match):
         """Construct from dict of device matching attributes."""
-        self._log = logging.getLogger(__name__)
-        self._match = match = match.copy()
+        # copy, so the caller's dict (e.g. cached file data) stays untouched:
+        self._match = match = {**self._defaults, **match}
         self._values = {}
         # mount options:
         if 'options' in match:
@@ -130,7 +211,12 @@ class DeviceFilter:
             if k not in self.VALID_PARAMETERS:
                 self._log.error(_('Unknown matching attribute: {!r}', k))
                 del self._match[k]
-        self._log.debug(_('new rule: {0}', self))
+        # compile patterns once, rather than on every match:
+        items = sorted(self._match.items(),
+                       key=lambda item: item[0] in _COSTLY_ATTRIBUTES)
+        self._matchers = [(k, compile_pattern(v)) for k, v in items]
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug(_('new rule: {0}', self))
 
     def __str__(self):
         return _('{0} -> {1}',
@@ -139,12 +225,20 @@ class DeviceFilter:
 
     def match(self, device):
         """Check if the device object matches this filter."""
-        return all(match_value(getattr(device, k), v)
-                   for k, v in self._match.items())
+        for k, match in self._matchers:
+            # objects that lack an attribute can't match on it:
+            value = getattr(device, k, _MISSING)
+            if value is _MISSING or not match(value):
+                return False
+        return True
 
     def has_value(self, kind):
         return kind in self._values
 
+    def matches_all(self):
+        """Check if this filter matches any device unconditionally."""
+        return not self._matchers
+
     def value(self, kind, device):
         """
         Get the value for the device object associated with this filter.
@@ -152,8 +246,10 @@ class DeviceFilter:
         If :meth:`match` is False for the device, the return value of this
         method is undefined.
         """
-        self._log.debug(_('{0} matched {1}',
-                          device.device_file or device.object_path, self))
+        # `_()` formats eagerly, which includes formatting the whole rule:
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug(_('{0} matched {1}',
+                              device.device_file or device.object_path, self))
         return self._values[kind]
 
 
@@ -161,18 +257,29 @@ class MountOptions(DeviceFilter):
 
     """Associate a list of mount options to matched devices."""
 
-    def __init__(self, config_item):
-        config_item.setdefault('options', None)
-        super().__init__(config_item)
+    __slots__ = ()
+    _defaults = {'options': None}
 
 
 class IgnoreDevice(DeviceFilter):
 
     """Associate a boolean ignore flag to matched devices."""
 
-    def __init__(self, config_item):
-        config_item.setdefault('ignore', True)
-        super().__init__(config_item)
+    __slots__ = ()
+    _defaults = {'ignore': True}
+
+
+class _AttributeCache:
+
+    """Device proxy that computes every attribute at most once."""
+
+    def __init__(self, device):
+        self._device = device
+
+    def __getattr__(self, name):
+        value = getattr(self._device, name)
+        setattr(self, name, value)
+        return value
 
 
 def match_config(filters, device, kind, default):
@@ -185,19 +292,74 @@ def match_config(filters, device, kind, default):
     :param default: default value
     :returns: value of the first matching filter
     """
+    # the values that a rule provides don't depend on the device, so check
+    # them once rather than again for every parent device:
+    rules = [(f, f.has_value(kind)) for f in filters
+             if f.has_value(kind) or f.has_value('skip')]
     while device is not None:
-        for f in filters:
-            if f.has_value(kind) and f.match(device):
+        # rules often test the same attributes, e.g. the built-in rules check
+        # symlinks, loop_file and is_ignored twice each:
+        attrs = _AttributeCache(device)
+        for f, has_value in rules:
+            if not f.match(attrs):
+                continue
+            if has_value:
                 return f.value(kind, device)
             # 'skip' allows skipping further rules and directly moving on
             # lookup on the parent device:
-            if f.has_value('skip') and f.match(device) and (
-                    f.value('skip', device) in (True, 'all', kind)):
+            if f.value('skip', device) in (True, 'all', kind):
                 break
         device = device.partition_slave or device.luks_cleartext_slave
     return default
 
 
+def select_filters(filters, kind):
+    """
+    Select the filters that can have an effect on :func:`match_config` for
+    the given value kind.
+
+    :param list filters: device filters
+    :param str kind: value kind
+    :returns: tuple of filters, in their original order
+    """
+    selected = []
+    for f in filters:
+        if f.has_value(kind):
+            selected.append(f)
+            # an unconditional rule ends every lookup, including on the
+            # parent devices, so the filters after it are never consulted:
+            if f.matches_all():
+                break
+        elif f.has_value('skip'):
+            selected.append(f)
+    return tuple(selected)
+
+
+@lru_cache(maxsize=4)
+def _load_file(path, mtime, size):
+    """
+    Parse a JSON or YAML config file.
+
+    The ``mtime`` and ``size`` arguments are only used as part of the cache
+    key, so that the file is parsed again when it has been modified. The
+    size catches edits within the timestamp resolution of the filesystem.
+    """
+    if os.path.splitext(path)[1].lower() == '.json':
+        from json import loads
+    else:
+        loads = _yaml_loads
+    # read the file in one go rather than letting the parser read chunks:
+    with open(path) as f:
+        return loads(f.read())
+
+
+def _yaml_loads(text):
+    """Parse YAML, using the libyaml based loader if it is available."""
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    return yaml.load(text, Loader=loader)
+
+
 class Config:
 
     """Udiskie config in memory representation."""
@@ -209,11 +371,8 @@ class Config:
     @classmethod
     def default_pathes(cls):
         """Return the default config file paths as a list."""
-        config_home = (
-            os.environ.get('XDG_CONFIG_HOME') or
-            os.path.expanduser('~/.config'))
-        return [os.path.join(config_home, 'udiskie', 'config.yml'),
-                os.path.join(config_home, 'udiskie', 'config.json')]
+        return [os.path.join(_config_home, 'udiskie', 'config.yml'),
+                os.path.join(_config_home, 'udiskie', 'config.json')]
 
     @classmethod
     def from_file(cls, path=None):
@@ -231,25 +390,35 @@ class Config:
                     logging.getLogger(__name__).debug(
                         _("Failed to read config file: {0}", exc_message(e)))
                 except ImportError as e:
-                    logging.getLogger(__name__).warn(
+                    logging.getLogger(__name__).warning(
                         _("Failed to read {0!r}: {1}", path, exc_message(e)))
             return cls({})
         # False/'' => no config
         if not path:
             return cls({})
-        if os.path.splitext(path)[1].lower() == '.json':
-            from json import load
-        else:
-            from yaml import safe_load as load
-        with open(path) as f:
-            return cls(load(f))
+        # missing files (e.g. the unused default path) fail right here,
+        # without a cache lookup and without trying to open() them:
+        st = os.stat(path)
+        return cls(_load_file(os.path.abspath(path), st.st_mtime_ns, st.st_size))
+
+    @staticmethod
+    def clear_cache():
+        """
+        Forget parsed config files, so they are read again on next use.
+
+        :meth:`from_file` caches parsed files process-wide by path, mtime
+        and size. Use this when a file may have been replaced without a
+        visible change to these, or to start from a clean state in tests.
+        """
+        _load_file.cache_clear()
 
     @property
     def device_config(self):
-        device_config = map(DeviceFilter, self._data.get('device_config', []))
-        mount_options = map(MountOptions, self._data.get('mount_options', []))
-        ignore_device = map(IgnoreDevice, self._data.get('ignore_device', []))
-        return list(device_config) + list(mount_options) + list(ignore_device)
+        return [rule_type(item)
+                for section, rule_type in (('device_config', DeviceFilter),
+                                           ('mount_options', MountOptions),
+                                           ('ignore_device', IgnoreDevice))
+                for item in self._data.get(section, [])]
 
     @property
     def program_options(self):
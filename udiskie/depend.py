@@ -5,6 +5,7 @@ are installed.
 
 import os
 import logging
+from functools import lru_cache
 
 from gi import require_version
 
@@ -33,15 +34,28 @@ if not _in_X and not _in_Wayland and os.environ.get('XDG_RUNTIME_DIR'):
     _in_Wayland = os.path.exists(os.path.join(
         os.environ.get('XDG_RUNTIME_DIR'), 'wayland-0'))
 
-_has_Gtk = (3 if check_version('Gtk', '3.0') else
+
+# The typelib probes are comparatively expensive and only needed by the
+# daemon, so they are performed on first use rather than at import time:
+
+@lru_cache(maxsize=None)
+def _has_Gtk():
+    return (3 if check_version('Gtk', '3.0') else
             2 if check_version('Gtk', '2.0') else
             0)
 
-_has_Notify = check_version('Notify', '0.7')
-_has_AppIndicator3 = (
-    check_version('AyatanaAppIndicator3', '0.1') or
-    check_version('AppIndicator3', '0.1')
-)
+
+@lru_cache(maxsize=None)
+def _has_Notify():
+    return check_version('Notify', '0.7')
+
+
+@lru_cache(maxsize=None)
+def _has_AppIndicator3():
+    return (
+        check_version('AyatanaAppIndicator3', '0.1') or
+        check_version('AppIndicator3', '0.1')
+    )
 
 
 def require_Gtk(min_version=2):
@@ -52,10 +66,10 @@ def require_Gtk(min_version=2):
     """
     if not (_in_X or _in_Wayland):
         raise RuntimeError('Not in X or Wayland session.')
-    if _has_Gtk < min_version:
+    if _has_Gtk() < min_version:
         raise RuntimeError('Module gi.repository.Gtk not available!')
-    if _has_Gtk == 2:
-        logging.getLogger(__name__).warn(
+    if _has_Gtk() == 2:
+        logging.getLogger(__name__).warning(
             _("Missing runtime dependency GTK 3. Falling back to GTK 2 "
               "for password prompt"))
     from gi.repository import Gtk
@@ -67,16 +81,16 @@ def require_Gtk(min_version=2):
 
 
 def require_Notify():
-    if not _has_Notify:
+    if not _has_Notify():
         raise RuntimeError('Module gi.repository.Notify not available!')
     from gi.repository import Notify
     return Notify
 
 
 def require_AppIndicator3():
-    if _has_AppIndicator3 == ('AppIndicator3', '0.1'):
+    if _has_AppIndicator3() == ('AppIndicator3', '0.1'):
         from gi.repository import AppIndicator3
-    elif _has_AppIndicator3 == ('AyatanaAppIndicator3', '0.1'):
+    elif _has_AppIndicator3() == ('AyatanaAppIndicator3', '0.1'):
         from gi.repository import AyatanaAppIndicator3 as AppIndicator3
     else:
         raise RuntimeError('Module gi.repository.AppIndicator3 not available!')
@@ -9,8 +9,8 @@ import logging
 import os
 
 from .async_ import to_coro, gather, sleep
-from .common import wraps, setdefault, exc_message, format_exc
-from .config import IgnoreDevice, match_config
+from .common import wraps, setdefault, exc_message, LazyTraceback
+from .config import IgnoreDevice, match_config, select_filters
 from .locale import _
 
 
@@ -28,7 +28,7 @@ def _error_boundary(fn):
         except Exception as e:
             self._log.error(_('failed to {0} {1}: {2}',
                               fn.__name__, device, exc_message(e)))
-            self._log.debug(format_exc())
+            self._log.debug(LazyTraceback())
             return False
     return wrapper
 
@@ -83,6 +83,7 @@ class Mounter:
             IgnoreDevice({'is_external': False,
                           'is_toplevel': True, 'ignore': True}),
             IgnoreDevice({'is_ignored': True, 'ignore': True})]
+        self._config_by_kind = {}
         self._prompt = prompt
         self._browser = browser
         self._terminal = terminal
@@ -90,6 +91,17 @@ class Mounter:
         self._cache_hint = cache_hint
         self._log = logging.getLogger(__name__)
 
+    def _match_config(self, device, kind, default):
+        """Lookup the configured value of the given kind for the device."""
+        # There is no need to match the device against rules that can't have
+        # an effect on this kind of value:
+        try:
+            filters = self._config_by_kind[kind]
+        except KeyError:
+            filters = self._config_by_kind[kind] = select_filters(
+                self._config, kind)
+        return match_config(filters, device, kind, default)
+
     def _find_device(self, device_or_path):
         """Find device object from path."""
         return self.udisks.find(device_or_path)
@@ -155,12 +167,12 @@ class Mounter:
         """
         device = self._find_device(device)
         if not self.is_handleable(device) or not device.is_filesystem:
-            self._log.warn(_('not mounting {0}: unhandled device', device))
+            self._log.warning(_('not mounting {0}: unhandled device', device))
             return False
         if device.is_mounted:
             self._log.info(_('not mounting {0}: already mounted', device))
             return True
-        options = match_config(self._config, device, 'options', None)
+        options = self._match_config(device, 'options', None)
         kwargs = dict(options=options)
         self._log.debug(_('mounting {0} with {1}', device, kwargs))
         self._check_device_before_mount(device)
@@ -170,7 +182,7 @@ class Mounter:
 
     def _check_device_before_mount(self, device):
         if device.id_type == 'ntfs' and not which('ntfs-3g'):
-            self._log.warn(_(
+            self._log.warning(_(
                 "Mounting NTFS device with default driver.\n"
                 "Please install 'ntfs-3g' if you experience problems or the "
                 "device is readonly."))
@@ -185,7 +197,7 @@ class Mounter:
         """
         device = self._find_device(device)
         if not self.is_handleable(device) or not device.is_filesystem:
-            self._log.warn(_('not unmounting {0}: unhandled device', device))
+            self._log.warning(_('not unmounting {0}: unhandled device', device))
             return False
         if not device.is_mounted:
             self._log.info(_('not unmounting {0}: not mounted', device))
@@ -206,7 +218,7 @@ class Mounter:
         """
         device = self._find_device(device)
         if not self.is_handleable(device) or not device.is_crypto:
-            self._log.warn(_('not unlocking {0}: unhandled device', device))
+            self._log.warning(_('not unlocking {0}: unhandled device', device))
             return False
         if device.is_unlocked:
             self._log.info(_('not unlocking {0}: already unlocked', device))
@@ -253,7 +265,7 @@ class Mounter:
             await device.unlock_keyfile(password)
         except Exception:
             self._log.debug(_('failed to unlock {0} using cached password', device))
-            self._log.debug(format_exc())
+            self._log.debug(LazyTraceback())
             return False
         self._log.info(_('unlocked {0} using cached password', device))
         return True
@@ -261,7 +273,7 @@ class Mounter:
     async def _unlock_from_keyfile(self, device):
         if not self.udisks.keyfile_support:
             return False
-        filename = match_config(self._config, device, 'keyfile', None)
+        filename = self._match_config(device, 'keyfile', None)
         if filename is None:
             self._log.debug(_('No matching keyfile rule for {}.', device))
             return False
@@ -269,14 +281,14 @@ class Mounter:
             with open(filename, 'rb') as f:
                 keyfile = f.read()
         except IOError:
-            self._log.warn(_('keyfile for {0} not found: {1}', device, filename))
+            self._log.warning(_('keyfile for {0} not found: {1}', device, filename))
             return False
         self._log.debug(_('unlocking {0} using keyfile {1}', device, filename))
         try:
             await device.unlock_keyfile(keyfile)
         except Exception:
             self._log.debug(_('failed to unlock {0} using keyfile', device))
-            self._log.debug(format_exc())
+            self._log.debug(LazyTraceback())
             return False
         self._log.info(_('unlocked {0} using keyfile', device))
         return True
@@ -304,7 +316,7 @@ class Mounter:
         """
         device = self._find_device(device)
         if not self.is_handleable(device) or not device.is_crypto:
-            self._log.warn(_('not locking {0}: unhandled device', device))
+            self._log.warning(_('not locking {0}: unhandled device', device))
             return False
         if not device.is_unlocked:
             self._log.info(_('not locking {0}: not unlocked', device))
@@ -502,11 +514,11 @@ class Mounter:
         """
         device = self._find_device(device)
         if not self.is_handleable(device):
-            self._log.warn(_('not ejecting {0}: unhandled device'))
+            self._log.warning(_('not ejecting {0}: unhandled device'))
             return False
         drive = device.drive
         if not (drive.is_drive and drive.is_ejectable):
-            self._log.warn(_('not ejecting {0}: drive not ejectable', drive))
+            self._log.warning(_('not ejecting {0}: drive not ejectable', drive))
             return False
         if force:
             # Can't autoremove 'device.drive', because that will be filtered
@@ -528,11 +540,11 @@ class Mounter:
         """
         device = self._find_device(device)
         if not self.is_handleable(device):
-            self._log.warn(_('not detaching {0}: unhandled device', device))
+            self._log.warning(_('not detaching {0}: unhandled device', device))
             return False
         drive = device.root
         if not drive.is_detachable and not drive.is_loop:
-            self._log.warn(_('not detaching {0}: drive not detachable', drive))
+            self._log.warning(_('not detaching {0}: drive not detachable', drive))
             return False
         if force:
             await self.auto_remove(drive, force=True)
@@ -601,7 +613,7 @@ class Mounter:
 
         # Create pseudo Device object to enable config matching:
         loopfile = self.udisks.loopfile_device(image)
-        options = match_config(self._config, loopfile, 'options', [])
+        options = self._match_config(loopfile, 'options', [])
 
         # TODO: also set 'offset', 'size', 'no_part_scan' from config
         if read_only is None:
@@ -642,7 +654,7 @@ class Mounter:
         """
         device = self._find_device(device)
         if not self.is_handleable(device) or not device.is_loop:
-            self._log.warn(_('not deleting {0}: unhandled device', device))
+            self._log.warning(_('not deleting {0}: unhandled device', device))
             return False
         if remove:
             await self.auto_remove(device, force=True)
@@ -668,10 +680,10 @@ class Mounter:
     def is_automount(self, device, default=True):
         if not self.is_handleable(device):
             return False
-        return match_config(self._config, device, 'automount', default)
+        return self._match_config(device, 'automount', default)
 
     def _ignore_device(self, device):
-        return match_config(self._config, device, 'ignore', False)
+        return self._match_config(device, 'ignore', False)
 
     def is_addable(self, device, automount=True):
         """Check if device can be added with ``auto_add``."""
@@ -7,7 +7,7 @@ import logging
 from gi.repository import GLib
 
 from .async_ import run_bg
-from .common import exc_message, DaemonBase, format_exc
+from .common import exc_message, DaemonBase, LazyTraceback
 from .mount import DeviceActions
 from .locale import _
 
@@ -205,7 +205,7 @@ class Notify(DaemonBase):
             # udiskie's logic useless by raising an exception before the
             # automount handler gets invoked.
             self._log.error(_("Failed to show notification: {0}", exc_message(exc)))
-            self._log.debug(format_exc())
+            self._log.debug(LazyTraceback())
 
     def _add_action(self, notification, device, action, label, callback, *args):
         """
@@ -5,6 +5,8 @@ User prompt utility.
 from udiskie.depend import has_Gtk, require_Gtk
 from udiskie.common import is_utf8
 
+from functools import lru_cache
+from operator import attrgetter
 from shutil import which
 import getpass
 import logging
@@ -13,11 +15,6 @@ import string
 import subprocess
 import sys
 
-try:
-    from importlib.resources import read_text
-except ImportError:  # for Python<3.7
-    from importlib_resources import read_text
-
 from .async_ import exec_subprocess, run_bg, Future
 from .locale import _
 from .config import DeviceFilter
@@ -27,7 +24,14 @@ Gtk = None
 __all__ = ['password', 'browser']
 
 
-dialog_definition = read_text(__package__, 'password_dialog.ui')
+@lru_cache(maxsize=None)
+def dialog_definition():
+    """Load the password dialog definition when it is first needed."""
+    try:
+        from importlib.resources import read_text
+    except ImportError:  # for Python<3.7
+        from importlib_resources import read_text
+    return read_text(__package__, 'password_dialog.ui')
 
 
 class Dialog(Future):
@@ -88,7 +92,7 @@ class PasswordDialog(Dialog):
         global Gtk
         Gtk = require_Gtk()
         builder = Gtk.Builder.new()
-        builder.add_from_string(dialog_definition)
+        builder.add_from_string(dialog_definition())
         window = builder.get_object('entry_dialog')
         self.entry = builder.get_object('entry')
 
@@ -172,6 +176,16 @@ async def get_password_tty(device, options):
         return None
 
 
+def _attrs_getter(names):
+    """Return a function that retrieves the named attributes as tuple."""
+    if len(names) > 1:
+        return attrgetter(*names)
+    if names:
+        get = attrgetter(*names)
+        return lambda obj: (get(obj),)
+    return lambda obj: ()
+
+
 class DeviceCommand:
 
     """
@@ -190,10 +204,14 @@ class DeviceCommand:
         # obtain a list of used fields names
         formatter = string.Formatter()
         self.used_attrs = set()
+        # arguments without replacement fields are formatted only once here,
+        # the others are marked as None:
+        self._static_argv = []
         for arg in self.argv:
-            for text, kwd, spec, conv in formatter.parse(arg):
-                if kwd is None:
-                    continue
+            fields = [kwd for text, kwd, spec, conv in formatter.parse(arg)
+                      if kwd is not None]
+            self._static_argv.append(None if fields else arg.format())
+            for kwd in fields:
                 if kwd in DeviceFilter.VALID_PARAMETERS:
                     self.used_attrs.add(kwd)
                 if kwd not in DeviceFilter.VALID_PARAMETERS and \
@@ -202,15 +220,18 @@ class DeviceCommand:
                     logging.getLogger(__name__).error(_(
                         'Unknown device attribute {!r} in format string: {!r}',
                         kwd, arg))
+        self._attr_names = tuple(self.used_attrs)
+        self._get_attrs = _attrs_getter(self._attr_names)
 
     async def __call__(self, device):
         """
         Invoke the subprocess to ask the user to enter a password for unlocking
         the specified device.
         """
-        attrs = {attr: getattr(device, attr) for attr in self.used_attrs}
+        attrs = dict(zip(self._attr_names, self._get_attrs(device)))
         attrs.update(self.extra)
-        argv = [arg.format(**attrs) for arg in self.argv]
+        argv = [arg.format_map(attrs) if static is None else static
+                for arg, static in zip(self.argv, self._static_argv)]
         try:
             stdout = await exec_subprocess(argv, self.capture)
         except subprocess.CalledProcessError:
@@ -251,7 +272,7 @@ def browser(browser_name='xdg-open'):
     if executable is None:
         # Why not raise an exception? -I think it is more convenient (for
         # end users) to have a reasonable default, without enforcing it.
-        logging.getLogger(__name__).warn(
+        logging.getLogger(__name__).warning(
             _("Can't find file browser: {0!r}. "
               "You may want to change the value for the '-f' option.",
               browser_name))
@@ -5,7 +5,7 @@ Tray icon for udiskie.
 from gi.repository import Gio
 from gi.repository import Gtk
 
-from .async_ import run_bg, Future
+from .async_ import run_bg, run_soon, Future
 from .common import setdefault, DaemonBase, cachedmethod
 from .locale import _
 from .mount import Action, prune_empty_node
@@ -166,6 +166,13 @@ class TrayMenu:
         ]
         self._checkbox_workaround = checkbox_workaround
         self._update_workaround = update_workaround
+        # onclick handlers of the static option entries are created once here
+        # rather than on every menu build:
+        self._on_losetup = run_bg(lambda _: self._losetup())
+        self._on_toggle_automount = (
+            lambda _: self._daemon.automounter.toggle_on())
+        self._on_toggle_notify = lambda _: self._daemon.notify.toggle()
+        self._on_quit = lambda _: self._quit_action()
 
     def __call__(self, menu, extended=True):
         """Populate the Gtk.Menu with udiskie mount operations."""
@@ -197,19 +204,19 @@ class TrayMenu:
         menu.append(self._menuitem(
             _('Mount disc image'),
             self._icons.get_icon('losetup', Gtk.IconSize.MENU),
-            run_bg(lambda _: self._losetup())
+            self._on_losetup,
         ))
         menu.append(Gtk.SeparatorMenuItem())
         menu.append(self._menuitem(
             _("Enable automounting"),
             icon=None,
-            onclick=lambda _: self._daemon.automounter.toggle_on(),
+            onclick=self._on_toggle_automount,
             checked=self._daemon.automounter.is_on(),
         ))
         menu.append(self._menuitem(
             _("Enable notifications"),
             icon=None,
-            onclick=lambda _: self._daemon.notify.toggle(),
+            onclick=self._on_toggle_notify,
             checked=self._daemon.notify.active,
         ))
         # append menu item for closing the application
@@ -218,7 +225,7 @@ class TrayMenu:
             menu.append(self._menuitem(
                 _('Quit'),
                 self._icons.get_icon('quit', Gtk.IconSize.MENU),
-                lambda _: self._quit_action()
+                self._on_quit,
             ))
 
     async def _losetup(self):
@@ -457,10 +464,11 @@ class UdiskieStatusIcon(DaemonBase):
         self._quit_action = menumaker._quit_action
         self.smart = smart
         self.active = False
+        self._update_pending = False
         self.events = {
-            'device_changed': self.update,
-            'device_added': self.update,
-            'device_removed': self.update,
+            'device_changed': self._schedule_update,
+            'device_added': self._schedule_update,
+            'device_removed': self._schedule_update,
         }
 
     def activate(self):
@@ -496,3 +504,20 @@ class UdiskieStatusIcon(DaemonBase):
             self._icon.show(self.has_menu())
         else:
             self._icon.show(True)
+
+    def _schedule_update(self, *args):
+        """
+        Update once the main loop is idle.
+
+        UDisks often emits bursts of events for the same device (e.g. one
+        PropertiesChanged per interface), and each update in smart mode has
+        to rebuild the device tree. This coalesces them into a single update.
+        """
+        if not self._update_pending:
+            self._update_pending = True
+            run_soon(self._deferred_update)
+
+    def _deferred_update(self):
+        self._update_pending = False
+        if self.active:
+            self.update()
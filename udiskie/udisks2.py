@@ -9,18 +9,27 @@ Requires UDisks2 2.1.1 as described here:
 This wraps the DBus API of Udisks2.
 """
 
-from copy import copy, deepcopy
+from copy import copy
+from functools import lru_cache
 import logging
 
 from gi.repository import GLib
 
 import udiskie.dbus as dbus
-from .common import Emitter, AttrDictView, decode_ay, samefile, sameuuid
+from .common import (
+    Emitter, AttrDictView, decode_ay, file_key, samefile, sameuuid)
 from .locale import _
 
 __all__ = ['Daemon']
 
 
+_object_kinds = {
+    'block_devices': 'device',
+    'drives': 'drive',
+    'jobs': 'job',
+}
+
+
 def object_kind(object_path):
     """
     Parse the kind of object from an UDisks2 object path.
@@ -31,11 +40,7 @@ def object_kind(object_path):
         /org/freedesktop/UDisks2/jobs/5             => job
     """
     try:
-        return {
-            'block_devices': 'device',
-            'drives': 'drive',
-            'jobs': 'job',
-        }.get(object_path.split('/')[4])
+        return _object_kinds.get(object_path.split('/')[4])
     except IndexError:
         return None
 
@@ -45,6 +50,13 @@ def filter_opt(opt):
     return {k: GLib.Variant(*v) for k, v in opt.items() if v[1] is not None}
 
 
+def join_nonempty(sep, a, b):
+    """Join two strings with ``sep``, leaving out empty ones."""
+    if a and b:
+        return a + sep + b
+    return a or b or ''
+
+
 Interface = {
     'Manager':          'org.freedesktop.UDisks2.Manager',
     'Drive':            'org.freedesktop.UDisks2.Drive',
@@ -91,20 +103,29 @@ class PropertyHub:
     def __init__(self, interfaces_and_properties):
         """Initialize from (dict)."""
         self._interfaces_and_properties = interfaces_and_properties
+        self._views = {}
 
     def __getattr__(self, key):
         """Return an AttrDictView for properties on the requested interface."""
-        interface = Interface[key]
-        try:
-            return AttrDictView(self._interfaces_and_properties[interface])
-        except KeyError:
-            return PropertiesNotAvailable()
+        properties = self._interfaces_and_properties.get(Interface[key])
+        if properties is None:
+            return _properties_not_available
+        # Reuse the view while the interface's properties are still held by
+        # the same dict. When an interface is re-added, it is replaced:
+        cached = self._views.get(key)
+        if cached is not None and cached[0] is properties:
+            return cached[1]
+        view = AttrDictView(properties)
+        self._views[key] = (properties, view)
+        return view
 
 
 class PropertiesNotAvailable:
 
     """Null class for properties of an unavailable interface."""
 
+    __slots__ = ()
+
     def __bool__(self):
         return False
 
@@ -113,6 +134,10 @@ class PropertiesNotAvailable:
         return None
 
 
+# stateless, so a single instance can be shared by all devices:
+_properties_not_available = PropertiesNotAvailable()
+
+
 # ----------------------------------------
 # Device wrapper
 # ----------------------------------------
@@ -140,8 +165,16 @@ class Device:
 
     def __eq__(self, other):
         """Comparison by object_path."""
+        if self is other:
+            return True
+        if isinstance(other, Device):
+            return self.object_path == other.object_path
         return self.object_path == str(other)
 
+    def __hash__(self):
+        """Hash by object_path, consistent with comparison."""
+        return hash(self.object_path)
+
     def __ne__(self, other):
         """Comparison by object_path."""
         return not (self == other)
@@ -460,9 +493,9 @@ class Device:
         """Get wrapper to the unlocked luks cleartext device."""
         if not self.is_luks:
             return None
-        for device in self._daemon:
-            if device.luks_cleartext_slave == self:
-                return device
+        for path in self._daemon.paths_with(
+                'Block', 'CryptoBackingDevice', self.object_path):
+            return self._daemon[path]
         return None
 
     @property
@@ -542,13 +575,21 @@ class Device:
     # derived properties
     # ----------------------------------------
 
-    def is_file(self, path):
+    def is_file(self, path, key=file_key):
         """Comparison by mount and device file path."""
-        return (samefile(path, self.device_file) or
-                samefile(path, self.loop_file) or
-                any(samefile(path, mp) for mp in self.mount_paths) or
-                sameuuid(path, self.id_uuid) or
-                sameuuid(path, self.partition_uuid))
+        # check the cheap string comparisons before doing any syscalls, and
+        # skip empty paths (which would compare equal to '.'):
+        device_file = self.device_file
+        loop_file = self.loop_file
+        mount_paths = self.mount_paths
+        return (sameuuid(path, self.id_uuid) or
+                sameuuid(path, self.partition_uuid) or
+                # paths given literally (the usual case) need no stat():
+                bool(path) and (path == device_file or path == loop_file or
+                                path in mount_paths) or
+                device_file and samefile(path, device_file, key) or
+                loop_file and samefile(path, loop_file, key) or
+                any(samefile(path, mp, key) for mp in mount_paths))
 
     @property
     def parent_object_path(self):
@@ -570,8 +611,9 @@ class Device:
         if self.is_mounted or self.is_unlocked:
             return True
         if self.is_partition_table:
-            for device in self._daemon:
-                if device.partition_slave == self and device.in_use:
+            for path in self._daemon.paths_with(
+                    'Partition', 'Table', self.object_path):
+                if self._daemon[path].in_use:
                     return True
         return False
 
@@ -590,30 +632,32 @@ class Device:
         """Path of the crypto backing device or the device itself."""
         return (self.luks_cleartext_slave or self).device_presentation
 
+    def _ui_id(self):
+        """Label or UUID of the unlocked partition or the device itself."""
+        # look up the cleartext holder only once for both:
+        target = self.luks_cleartext_holder or self
+        return target.id_label or target.id_uuid
+
     @property
     def ui_label(self):
         """UI string identifying the partition if possible."""
-        return ': '.join(filter(None, [
+        return join_nonempty(
+            ': ',
             self.ui_device_presentation,
-            self.ui_id_label or self.ui_id_uuid or self.drive_label
-        ]))
+            self._ui_id() or self.drive_label)
 
     @property
     def ui_device_label(self):
         """UI string identifying the device (drive) if toplevel."""
-        return ': '.join(filter(None, [
+        return join_nonempty(
+            ': ',
             self.ui_device_presentation,
-            self.loop_file or
-            self.drive_label or self.ui_id_label or self.ui_id_uuid
-        ]))
+            self.loop_file or self.drive_label or self._ui_id())
 
     @property
     def drive_label(self):
         """Return drive label."""
-        return ' '.join(filter(None, [
-            self.drive_vendor,
-            self.drive_model,
-        ]))
+        return join_nonempty(' ', self.drive_vendor, self.drive_model)
 
 
 # ----------------------------------------
@@ -654,14 +698,40 @@ class Daemon(Emitter):
         This searches through all accessible devices and compares device
         path as well as mount paths.
         """
-        if isinstance(path, Device):
-            return path
+        device, = self.find_all([path])
+        if not isinstance(device, Device):
+            raise FileNotFoundError(_('no device found owning "{0}"', path))
+        return device
+
+    def find_all(self, paths):
+        """
+        Get device proxies for multiple paths with a single pass over all
+        devices.
+
+        Returns a list with one entry for each of the given paths. Paths that
+        are not owned by any device are returned unchanged, so that the error
+        can be reported by whoever uses them.
+        """
+        found = list(paths)
+        # map each distinct path to its positions, so that repeated arguments
+        # are only compared once against each device:
+        pending = {}
+        for i, path in enumerate(paths):
+            if not isinstance(path, Device):
+                pending.setdefault(path, []).append(i)
+        # the searched paths are compared against every device, so stat them
+        # only once (memoized only for the duration of this lookup):
+        key = lru_cache(maxsize=None)(file_key)
         for device in self:
-            if device.is_file(path):
+            if not pending:
+                break
+            for path in [path for path in pending
+                         if device.is_file(path, key)]:
                 self._log.debug(_('found device owning "{0}": "{1}"',
                                   path, device))
-                return device
-        raise FileNotFoundError(_('no device found owning "{0}"', path))
+                for i in pending.pop(path):
+                    found[i] = device
+        return found
 
     def __init__(self, proxy, version):
 
@@ -688,12 +758,13 @@ class Daemon(Emitter):
         self._log.debug(_('Keyfile support: {0}', self.keyfile_support))
 
         self._proxy = proxy
+        self._bus = bus = proxy.object.bus
+        self._manager = None
         self._objects = {}
 
         proxy.connect('InterfacesAdded', self._interfaces_added)
         proxy.connect('InterfacesRemoved', self._interfaces_removed)
 
-        bus = proxy.object.bus
         bus.connect(Interface['Properties'],
                     'PropertiesChanged',
                     None,
@@ -726,11 +797,17 @@ class Daemon(Emitter):
             Interface['Manager'], 'Version'))
         return version
 
+    async def _get_manager(self):
+        """Get the (cached) proxy for the UDisks2 Manager interface."""
+        if self._manager is None:
+            service = (self.BusName,
+                       '/org/freedesktop/UDisks2/Manager',
+                       Interface['Manager'])
+            self._manager = await dbus.connect_service(*service)
+        return self._manager
+
     async def loop_setup(self, fd, options):
-        service = (self.BusName,
-                   '/org/freedesktop/UDisks2/Manager',
-                   Interface['Manager'])
-        manager = await dbus.connect_service(*service)
+        manager = await self._get_manager()
         object_path = await dbus.call_with_fd_list(
             manager._proxy, 'LoopSetup', '(ha{sv})',
             (0, filter_opt({
@@ -750,6 +827,20 @@ class Daemon(Emitter):
     def paths(self):
         return self._objects.keys()
 
+    def paths_with(self, interface, prop, value):
+        """
+        Iterate over the paths of all objects whose property ``prop`` on
+        the given interface equals ``value``.
+
+        This works on the raw object data, without creating a Device for
+        every object.
+        """
+        interface_name = Interface[interface]
+        for object_path, interfaces in self._objects.items():
+            properties = interfaces.get(interface_name)
+            if properties and properties.get(prop) == value:
+                yield object_path
+
     def get(self, object_path, interfaces_and_properties=None):
         """Create a Device instance from object path."""
         # check this before creating the DBus object for more
@@ -759,12 +850,13 @@ class Daemon(Emitter):
             if not interfaces_and_properties:
                 return None
         property_hub = PropertyHub(interfaces_and_properties)
-        method_hub = MethodHub(
-            self._proxy.object.bus.get_object(object_path))
+        method_hub = MethodHub(self._bus.get_object(object_path))
         return Device(self, object_path, property_hub, method_hub)
 
     def trigger(self, event, device, *args):
-        self._log.debug(_("+++ {0}: {1}", event, device))
+        # `_()` translates and formats eagerly, so skip it unless needed:
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug(_("+++ {0}: {1}", event, device))
         super().trigger(event, device, *args)
 
     # add objects / interfaces
@@ -859,16 +951,19 @@ class Daemon(Emitter):
 
         Called when a DBusProperty of any managed object changes.
         """
-        # update device state:
-        old_state = deepcopy(self._objects[object_path])
+        # update device state. Handlers may hold on to the old device, so
+        # every interface dict is copied, as later signals modify them in
+        # place. The property values themselves are only ever replaced, so
+        # they can be shared rather than deep-copied:
+        new_state = self._objects[object_path]
+        old_state = {k: copy(v) for k, v in new_state.items()}
         for property_name in invalidated_properties:
             try:
-                del self._objects[object_path][interface_name][property_name]
+                del new_state[interface_name][property_name]
             except KeyError:
                 pass
         for key, value in changed_properties.items():
-            self._objects[object_path][interface_name][key] = value
-        new_state = self._objects[object_path]
+            new_state[interface_name][key] = value
         # detect changes and trigger events:
         if interface_name == Interface['Drive']:
             self._detect_toggle(